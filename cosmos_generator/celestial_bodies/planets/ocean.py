@@ -2,6 +2,7 @@
 Ocean planet implementation.
 """
 from typing import Dict, Any, Optional
+import numpy as np
 from PIL import Image, ImageChops, ImageEnhance, ImageDraw
 
 from cosmos_generator.celestial_bodies.planets.abstract_planet import AbstractPlanet
@@ -106,16 +107,15 @@ class OceanPlanet(AbstractPlanet):
             # The threshold is based on the island_coverage parameter
             island_threshold = 1.0 - self.island_coverage
 
-            # Create a mask for the islands
-            island_mask = Image.new("L", (self.size, self.size), 0)
-            island_data = island_mask.load()
+            # Range of noise values above the threshold (guarded for zero coverage,
+            # where no pixel is above the threshold anyway)
+            island_range = max(1.0 - island_threshold, 1e-6)
 
-            for y in range(self.size):
-                for x in range(self.size):
-                    if islands_noise[y, x] > island_threshold:
-                        # Scale alpha based on how far above threshold
-                        alpha = int(255 * (islands_noise[y, x] - island_threshold) / (1.0 - island_threshold))
-                        island_data[x, y] = alpha
+            # Create a mask for the islands
+            # Scale alpha based on how far above threshold
+            island_alpha = 255 * (islands_noise - island_threshold) / island_range
+            island_alpha = np.where(islands_noise > island_threshold, island_alpha, 0).astype(np.uint8)
+            island_mask = Image.fromarray(island_alpha, "L")
 
             # Apply circular mask to the islands to keep them on the planet
             circle_mask = image_utils.create_circle_mask(self.size)
@@ -123,23 +123,23 @@ class OceanPlanet(AbstractPlanet):
 
             # Create island layer with land color from the selected palette
             land_color = self.color_palette.get_random_color("Ocean", f"land_{self.color_palette_id}")
-            islands = Image.new("RGBA", (self.size, self.size), (0, 0, 0, 0))
 
             # Fill the islands with the land color
-            for y in range(self.size):
-                for x in range(self.size):
-                    if island_mask.getpixel((x, y)) > 0:
-                        # Vary the land color slightly based on the island noise
-                        variation = (islands_noise[y, x] - island_threshold) / (1.0 - island_threshold)
-                        r, g, b = land_color
-                        # Lighter at higher elevations
-                        r = min(255, int(r * (1.0 + variation * 0.3)))
-                        g = min(255, int(g * (1.0 + variation * 0.3)))
-                        b = min(255, int(b * (1.0 + variation * 0.3)))
-
-                        # Set the pixel with alpha based on the mask
-                        alpha = island_mask.getpixel((x, y))
-                        islands.putpixel((x, y), (r, g, b, alpha))
+            # Vary the land color slightly based on the island noise
+            # Lighter at higher elevations
+            mask_array = np.asarray(island_mask)
+            on_island = mask_array > 0
+            variation = (islands_noise - island_threshold) / island_range
+            brightness = 1.0 + variation * 0.3
+
+            island_pixels = np.zeros((self.size, self.size, 4), dtype=np.uint8)
+            for channel, value in enumerate(land_color):
+                lit = np.minimum(255, value * brightness)
+                island_pixels[:, :, channel] = np.where(on_island, lit, 0).astype(np.uint8)
+
+            # Set the pixels with alpha based on the mask
+            island_pixels[:, :, 3] = mask_array
+            islands = Image.fromarray(island_pixels, "RGBA")
 
             # Apply lighting to islands to match the ocean
             # This is a simplified version since we're just adding the islands on top
@@ -154,48 +154,33 @@ class OceanPlanet(AbstractPlanet):
             result = Image.alpha_composite(ocean_image, islands)
 
         # Add a subtle shimmer effect to the water
-        shimmer = Image.new("RGBA", (self.size, self.size), (255, 255, 255, 0))
-        shimmer_data = shimmer.load()
+        # Use the waves noise for the shimmer effect
+        # Use the same shimmer effect for all styles, but more intense for water world
+        if self.ocean_style == "water_world":
+            # More intense shimmer with brighter reflections and a higher cap
+            threshold, gain, cap, color = 0.65, 10, 100, (255, 255, 255)
+        elif self.ocean_style == "reef":
+            # Medium shimmer with slightly blue-tinted reflections
+            threshold, gain, cap, color = 0.7, 9, 90, (240, 250, 255)
+        else:
+            # Normal shimmer for archipelago, with a higher threshold for less shimmer
+            threshold, gain, cap, color = 0.75, 8, 80, (255, 255, 255)
+
+        add_shimmer = waves_noise > threshold
+        if self.ocean_style == "archipelago":
+            # Only add shimmer to water areas (not islands)
+            add_shimmer &= mask_array <= 50
+
+        # Calculate alpha based on intensity
+        alpha = np.minimum(np.trunc(255 * (waves_noise - threshold) * gain), cap)
+
+        shimmer_pixels = np.zeros((self.size, self.size, 4), dtype=np.uint8)
+        shimmer_pixels[:, :, :3] = 255
+        shimmer_pixels[add_shimmer, :3] = color
+        shimmer_pixels[:, :, 3] = np.where(add_shimmer, alpha, 0).astype(np.uint8)
+        shimmer = Image.fromarray(shimmer_pixels, "RGBA")
         circle_mask = image_utils.create_circle_mask(self.size)
 
-        for y in range(self.size):
-            for x in range(self.size):
-                # For water world, add shimmer everywhere
-                # For archipelago, only add shimmer to water areas (not islands)
-                # For reef, add shimmer to water areas but not reef structures
-                add_shimmer = True
-                if self.ocean_style == "archipelago":
-                    # Check if we're on an island - only if we have an island_mask
-                    if 'island_mask' in locals() and island_mask.getpixel((x, y)) > 50:
-                        add_shimmer = False
-
-                if add_shimmer:
-                    # Use the waves noise for the shimmer effect
-                    # Use the same shimmer effect for both styles, but more intense for water world
-                    shimmer_intensity = waves_noise[y, x]
-
-                    if self.ocean_style == "water_world":
-                        # More intense shimmer for water world
-                        if shimmer_intensity > 0.65:  # Lower threshold for more shimmer
-                            # Calculate alpha based on intensity
-                            alpha = int(255 * (shimmer_intensity - 0.65) * 10)  # More intense
-                            # Brighter reflections for water world
-                            shimmer_data[x, y] = (255, 255, 255, min(alpha, 100))  # Higher cap
-                    elif self.ocean_style == "reef":
-                        # Subtle shimmer for reef areas
-                        if shimmer_intensity > 0.7:  # Medium threshold
-                            # Calculate alpha based on intensity
-                            alpha = int(255 * (shimmer_intensity - 0.7) * 9)  # Medium intensity
-                            # Slightly blue-tinted reflections for reef
-                            shimmer_data[x, y] = (240, 250, 255, min(alpha, 90))  # Medium cap
-                    else:
-                        # Normal shimmer for archipelago
-                        if shimmer_intensity > 0.75:  # Higher threshold for less shimmer
-                            # Calculate alpha based on intensity
-                            alpha = int(255 * (shimmer_intensity - 0.75) * 8)  # Less intense
-                            # Normal reflections for archipelago
-                            shimmer_data[x, y] = (255, 255, 255, min(alpha, 80))  # Lower cap
-
         # Apply the circle mask to the shimmer
         shimmer_alpha = shimmer.split()[3]
         shimmer_alpha = ImageChops.multiply(shimmer_alpha, circle_mask)
@@ -10,6 +10,7 @@ from PIL import Image, ImageDraw
 from cosmos_generator.core.fast_noise_generator import FastNoiseGenerator
 from cosmos_generator.core.color_palette import ColorPalette, Color
 from cosmos_generator.core.interfaces import TextureGeneratorInterface, NoiseGeneratorInterface, ColorPaletteInterface
+from cosmos_generator.utils import lighting_utils
 
 
 class TextureGenerator(TextureGeneratorInterface):
@@ -213,64 +214,13 @@ class TextureGenerator(TextureGeneratorInterface):
         if image.mode != "RGBA":
             image = image.convert("RGBA")
 
-        # Create a new image with the same size
-        result = Image.new("RGBA", image.size, (0, 0, 0, 0))
-
-        # Get pixel data
-        pixels = np.array(image)
-        result_pixels = np.array(result)
-
-        # Calculate light direction
-        light_rad = math.radians(light_angle)
-        light_x = math.cos(light_rad)
-        light_y = -math.sin(light_rad)  # Negative because y increases downward in images
-
-        # Apply lighting to the image
-        height, width = pixels.shape[:2]
-        center_x, center_y = width // 2, height // 2
-        radius = min(center_x, center_y)
-
-        for y in range(height):
-            for x in range(width):
-                # Skip if the pixel is transparent
-                if pixels[y, x, 3] == 0:
-                    continue
-
-                # Calculate position relative to center
-                dx = (x - center_x) / radius
-                dy = (y - center_y) / radius
-                distance = math.sqrt(dx*dx + dy*dy)
-
-                # Skip if outside the sphere
-                if distance > 1.0:
-                    continue
-
-                # Calculate surface normal at this point
-                # For a sphere, the normal is just the normalized vector from center to point
-                z = math.sqrt(1.0 - distance*distance)
-                nx, ny, nz = dx, dy, z
-
-                # Calculate dot product with light direction
-                dot = nx * light_x + ny * light_y + nz * 1.0
-
-                # Apply lighting factor
-                if dot < 0:
-                    # Point is facing away from light
-                    factor = 0.1  # Ambient light
-                else:
-                    # Apply light intensity and falloff
-                    factor = 0.1 + 0.9 * light_intensity * (dot ** falloff)
-
-                # Apply lighting to color
-                r = min(255, int(pixels[y, x, 0] * factor))
-                g = min(255, int(pixels[y, x, 1] * factor))
-                b = min(255, int(pixels[y, x, 2] * factor))
-
-                # Set result pixel
-                result_pixels[y, x] = [r, g, b, pixels[y, x, 3]]
+        # Apply lighting to the pixel data
+        pixels = lighting_utils.apply_sphere_lighting(
+            np.array(image), light_angle, light_intensity, falloff
+        )
 
         # Create new image from the modified pixel data
-        return Image.fromarray(result_pixels)
+        return Image.fromarray(pixels)
 
     # Removed unused texture generation methods
     # These methods are now implemented in the specific planet classes
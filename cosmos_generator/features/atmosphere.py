@@ -4,10 +4,14 @@ Atmosphere feature for planets.
 This module provides the Atmosphere class, which handles the creation and application
 of realistic atmospheric effects to planets, including scattering and limb brightening.
 """
-from typing import Optional, Tuple, Any
+from typing import Optional, Tuple, List
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import os
 import time
 import math
-from PIL import Image, ImageDraw, ImageFilter, ImageChops, ImageEnhance
+import numpy as np
+from PIL import Image
 
 from cosmos_generator.core.color_palette import ColorPalette, RGBA
 from cosmos_generator.utils.logger import logger
@@ -15,6 +19,209 @@ from cosmos_generator.core.interfaces import AtmosphereInterface, ColorPaletteIn
 
 # Type aliases
 Color = Tuple[int, int, int]
+# Radii (increasing) and the RGBA values of a layer at those radii
+RadialProfile = Tuple[np.ndarray, np.ndarray]
+
+
+# Spacing in pixels between the entries of the uint8 radial lookup tables
+_LUT_STEP = 1.0 / 16
+
+
+@functools.lru_cache(maxsize=8)
+def _lut_index_grid(canvas_size: int, center: int) -> np.ndarray:
+    """
+    Compute the radial lookup table entry of every pixel of a square canvas.
+
+    Each pixel maps to the table entry nearest to its distance to the center.
+    The grid only depends on the canvas geometry, so it is cached and shared
+    by every planet rendered at the same size.
+
+    Args:
+        canvas_size: Size of the canvas
+        center: Center point of the canvas
+
+    Returns:
+        Read-only 2D int32 array with the table index of each pixel
+    """
+    coords = np.arange(canvas_size, dtype=np.float32) - center
+    distance = np.sqrt(coords[np.newaxis, :] ** 2 + coords[:, np.newaxis] ** 2)
+    index = (distance * np.float32(1 / _LUT_STEP) + np.float32(0.5)).astype(np.int32)
+    index.setflags(write=False)
+    return index
+
+
+def _radial_window(canvas_size: int, center: int, radius: float) -> Tuple[slice, slice]:
+    """
+    Get the square region of the canvas that contains a circle.
+
+    Layers are transparent outside their outermost radius, so only this
+    window needs to be evaluated.
+
+    Args:
+        canvas_size: Size of the canvas
+        center: Center point of the canvas
+        radius: Radius of the circle
+
+    Returns:
+        Pair of (row, column) slices covering the circle
+    """
+    extent = int(math.ceil(radius)) + 1
+    window = slice(max(0, center - extent), min(canvas_size, center + extent + 1))
+    return window, window
+
+
+# Spacing in pixels between samples of the 1D radial profiles
+_PROFILE_STEP = 0.25
+
+
+@functools.lru_cache(maxsize=32)
+def _gaussian_kernel(sigma: float) -> np.ndarray:
+    """
+    Build a normalized 1D Gaussian kernel sampled every _PROFILE_STEP pixels.
+
+    Args:
+        sigma: Standard deviation of the Gaussian in pixels
+
+    Returns:
+        Read-only 1D float array whose values sum to 1
+    """
+    half_width = int(math.ceil(3 * sigma / _PROFILE_STEP))
+    offsets = np.arange(-half_width, half_width + 1) * _PROFILE_STEP
+    kernel = np.exp(-offsets ** 2 / (2 * sigma ** 2))
+    kernel /= kernel.sum()
+    kernel.setflags(write=False)
+    return kernel
+
+
+def _sample_radii(inner_radius: float, outer_radius: float, sigma: float) -> np.ndarray:
+    """
+    Sample radii covering a ring plus the reach of a Gaussian blur around it.
+
+    Args:
+        inner_radius: Inner radius of the ring
+        outer_radius: Outer radius of the ring
+        sigma: Standard deviation of the blur applied to the ring
+
+    Returns:
+        1D array of radii spaced _PROFILE_STEP pixels apart
+    """
+    return np.arange(max(0.0, inner_radius - 4 * sigma - 1), outer_radius + 4 * sigma + 1, _PROFILE_STEP)
+
+
+def _erfc(x: np.ndarray) -> np.ndarray:
+    """
+    Evaluate the complementary error function on an array.
+
+    Uses the Abramowitz and Stegun 7.1.26 approximation (absolute error below
+    1.5e-7), since math.erfc only works on scalars and scipy is not a
+    dependency of this project.
+
+    Args:
+        x: Array of arguments
+
+    Returns:
+        Float array with erfc(x) for every element of x
+    """
+    z = np.abs(x)
+    t = 1.0 / (1.0 + 0.3275911 * z)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    result = poly * np.exp(-z * z)
+    # erfc(-x) = 2 - erfc(x)
+    return np.where(x < 0, 2.0 - result, result)
+
+
+def _blur_radial_profile(profile: np.ndarray, sigma: float) -> np.ndarray:
+    """
+    Blur a radial profile sampled every _PROFILE_STEP pixels.
+
+    A thin ring around a large planet is blurred in 2D almost exactly as its
+    radial profile is blurred in 1D, so the Gaussian is applied to the few
+    hundred profile samples instead of to the whole canvas.
+
+    Args:
+        profile: Profile values at the radii from _sample_radii
+        sigma: Standard deviation of the blur in pixels
+
+    Returns:
+        1D float array with the blurred profile, as long as the input profile
+    """
+    # Profiles clipped at radius 0 around tiny planets can be shorter than the
+    # kernel, where mode="same" would return len(kernel) samples, so take the
+    # centered len(profile) samples of the full convolution instead
+    kernel = _gaussian_kernel(sigma)
+    start = (len(kernel) - 1) // 2
+    return np.convolve(profile, kernel, mode="full")[start:start + len(profile)]
+
+
+def _render_radial_profile(index: np.ndarray, radii: np.ndarray,
+                           channels: np.ndarray) -> np.ndarray:
+    """
+    Evaluate an RGBA radial profile at every pixel.
+
+    The profile is resampled into a fine uint8 lookup table once, so each
+    pixel costs a single table gather instead of float math per channel.
+    Pixels beyond the last radius are transparent black.
+
+    Args:
+        index: Lookup table index of each pixel (from _lut_index_grid)
+        radii: Increasing radii at which the profile is sampled
+        channels: Array of shape (len(radii), 4) with the RGBA values at those radii
+
+    Returns:
+        Array of shape index.shape + (4,) with uint8 RGBA values
+    """
+    # The farthest pixels of a rectangular region are at its corners
+    size = int(max(index[0, 0], index[0, -1], index[-1, 0], index[-1, -1])) + 1
+    lut_radii = np.arange(size) * _LUT_STEP
+    lut = np.empty((size, 4), dtype=np.uint8)
+    for channel in range(4):
+        values = np.interp(lut_radii, radii, channels[:, channel], right=0.0)
+        lut[:, channel] = np.clip(values + 0.5, 0, 255).astype(np.uint8)
+
+    # Gather whole RGBA pixels at once by viewing each table row as one uint32
+    pixels = lut.view(np.uint32)[:, 0].take(index)
+    return pixels.view(np.uint8).reshape(index.shape + (4,))
+
+
+def _composite_radial_profiles(profiles: List[RadialProfile]) -> RadialProfile:
+    """
+    Alpha-composite radial profiles on top of each other, in order.
+
+    Every atmosphere layer is a function of the distance to the center, so
+    the layers are stacked on their 1D profiles with the same "over" operator
+    as Image.alpha_composite, and the canvas is only evaluated once.
+
+    Args:
+        profiles: Radial profiles, from the bottom layer to the top one
+
+    Returns:
+        Radial profile of the stacked layers, transparent beyond each layer's radii
+    """
+    end = max(radii[-1] for radii, _ in profiles)
+    radii = np.arange(0.0, end + _PROFILE_STEP, _PROFILE_STEP)
+    color = np.zeros((len(radii), 3))
+    alpha = np.zeros(len(radii))
+
+    for layer_radii, layer_channels in profiles:
+        layer = np.column_stack([np.interp(radii, layer_radii, layer_channels[:, channel],
+                                           left=0.0, right=0.0)
+                                 for channel in range(4)])
+        layer_alpha = layer[:, 3] / 255.0
+        out_alpha = layer_alpha + alpha * (1.0 - layer_alpha)
+        weight = np.divide(layer_alpha, out_alpha, out=np.zeros_like(out_alpha), where=out_alpha > 0)
+        color += (layer[:, :3] - color) * weight[:, np.newaxis]
+        alpha = out_alpha
+
+    return radii, np.column_stack((color, alpha * 255.0))
+
+
+# Per-channel color shift coefficients, indexed by the dominant channel (R, G, B)
+# Red dominant: warm atmospheres, blue dominant: cool atmospheres
+_COLOR_SHIFT_COEFFICIENTS = (
+    (0.3, -0.1, -0.2),
+    (-0.1, 0.3, -0.1),
+    (-0.2, -0.1, 0.3),
+)
 
 
 class Atmosphere(AtmosphereInterface):
@@ -90,21 +297,8 @@ class Atmosphere(AtmosphereInterface):
         start_time = time.time()
         try:
             # Get atmosphere color if not provided
-            if color is None:
-                if base_color is not None and highlight_color is not None:
-                    # Use the provided planet colors to derive the atmosphere color
-                    # Blend them with some transparency for the atmosphere
-                    r = int((base_color[0] * 0.3 + highlight_color[0] * 0.7))
-                    g = int((base_color[1] * 0.3 + highlight_color[1] * 0.7))
-                    b = int((base_color[2] * 0.3 + highlight_color[2] * 0.7))
-                    # Add some transparency (alpha value)
-                    alpha = 75  # Default transparency
-                    atmosphere_color = (r, g, b, alpha)
-                else:
-                    # Fallback to the old method if no planet colors are provided
-                    atmosphere_color = self.color_palette.get_atmosphere_color(planet_type)
-            else:
-                atmosphere_color = color
+            atmosphere_color = self._resolve_atmosphere_color(planet_type, color,
+                                                              base_color, highlight_color)
 
             # Store the color for logging
             self.last_color = atmosphere_color
@@ -138,8 +332,7 @@ class Atmosphere(AtmosphereInterface):
             result = self._create_atmosphere(
                 planet_image,
                 shifted_atmosphere_color,
-                atmosphere_padding,
-                has_rings
+                atmosphere_padding
             )
 
             duration_ms = (time.time() - start_time) * 1000
@@ -160,6 +353,83 @@ class Atmosphere(AtmosphereInterface):
             logger.log_step("apply_atmosphere", duration_ms, f"Error: {str(e)}")
             raise
 
+    def apply_to_planets(self, planet_images: List[Image.Image], planet_type: str,
+                         has_rings: bool = False, color: Optional[RGBA] = None,
+                         base_color: Optional[Color] = None,
+                         highlight_color: Optional[Color] = None,
+                         max_workers: Optional[int] = None) -> List[Image.Image]:
+        """
+        Apply realistic atmospheric effects to several planet images in parallel.
+
+        The rendering work happens in NumPy and Pillow, which release the GIL,
+        so the images are processed on a thread pool. The atmosphere colors are
+        resolved in order before the work is submitted, so a seeded color palette
+        gives the same result as applying the atmosphere to each image in turn.
+
+        Args:
+            planet_images: Base planet images
+            planet_type: Type of planet (used to get the default color if not provided)
+            has_rings: Whether the planets have rings (affects atmosphere padding)
+            color: Optional custom color for the atmosphere
+            base_color: Optional base color of the planets (used to derive atmosphere color)
+            highlight_color: Optional highlight color of the planets (used to derive atmosphere color)
+            max_workers: Maximum number of threads (defaults to the number of CPUs)
+
+        Returns:
+            Planet images with realistic atmosphere applied, in the same order
+        """
+        if not self.enabled or len(planet_images) <= 1:
+            return [self.apply_to_planet(image, planet_type, has_rings, color,
+                                         base_color, highlight_color)
+                    for image in planet_images]
+
+        colors = [self._resolve_atmosphere_color(planet_type, color, base_color, highlight_color)
+                  for _ in planet_images]
+
+        workers = min(len(planet_images), max_workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                lambda image, atmosphere_color: self.apply_to_planet(image, planet_type, has_rings,
+                                                                     atmosphere_color),
+                planet_images, colors
+            ))
+
+        # Threads finish in any order, so store the color of the last image as
+        # applying the atmosphere to each image in turn would
+        self.last_color = colors[-1]
+        return results
+
+    def _resolve_atmosphere_color(self, planet_type: str, color: Optional[RGBA],
+                                  base_color: Optional[Color],
+                                  highlight_color: Optional[Color]) -> RGBA:
+        """
+        Get the atmosphere color to use for a planet.
+
+        Args:
+            planet_type: Type of planet (used to get the default color if not provided)
+            color: Optional custom color for the atmosphere
+            base_color: Optional base color of the planet (used to derive atmosphere color)
+            highlight_color: Optional highlight color of the planet (used to derive atmosphere color)
+
+        Returns:
+            Atmosphere color as RGBA
+        """
+        if color is not None:
+            return color
+
+        if base_color is not None and highlight_color is not None:
+            # Use the provided planet colors to derive the atmosphere color
+            # Blend them with some transparency for the atmosphere
+            r = int((base_color[0] * 0.3 + highlight_color[0] * 0.7))
+            g = int((base_color[1] * 0.3 + highlight_color[1] * 0.7))
+            b = int((base_color[2] * 0.3 + highlight_color[2] * 0.7))
+            # Add some transparency (alpha value)
+            alpha = 75  # Default transparency
+            return (r, g, b, alpha)
+
+        # Fallback to the old method if no planet colors are provided
+        return self.color_palette.get_atmosphere_color(planet_type)
+
     def _apply_color_shift(self, color: RGBA) -> RGBA:
         """
         Apply color shift to the atmosphere color.
@@ -182,29 +452,16 @@ class Atmosphere(AtmosphereInterface):
         if max_channel == 0:
             return color  # Avoid division by zero
 
-        # Calculate ratios
-        r_ratio = r / max_channel
-        g_ratio = g / max_channel
-        b_ratio = b / max_channel
-
         # Apply color shift based on planet type characteristics
         # Higher color_shift means more dramatic color changes
         # Don't scale down to make the effect more noticeable
         shift_factor = self.color_shift  # Use the full value for more dramatic effects
 
         # Enhance the dominant color and reduce others for more dramatic atmosphere
-        if r >= g and r >= b:  # Red dominant (warm atmospheres)
-            r = min(255, int(r * (1 + shift_factor * 0.3)))
-            g = int(g * (1 - shift_factor * 0.1))
-            b = int(b * (1 - shift_factor * 0.2))
-        elif g >= r and g >= b:  # Green dominant
-            g = min(255, int(g * (1 + shift_factor * 0.3)))
-            r = int(r * (1 - shift_factor * 0.1))
-            b = int(b * (1 - shift_factor * 0.1))
-        elif b >= r and b >= g:  # Blue dominant (cool atmospheres)
-            b = min(255, int(b * (1 + shift_factor * 0.3)))
-            r = int(r * (1 - shift_factor * 0.2))
-            g = int(g * (1 - shift_factor * 0.1))
+        # Ties go to red, then green, as the first channel holding the maximum
+        dominant = (r, g, b).index(max_channel)
+        r, g, b = (min(255, int(value * (1 + shift_factor * coefficient)))
+                   for value, coefficient in zip((r, g, b), _COLOR_SHIFT_COEFFICIENTS[dominant]))
 
         # Adjust alpha based on density
         adjusted_alpha = int(a * (0.7 + self.density * 0.6))
@@ -214,9 +471,7 @@ class Atmosphere(AtmosphereInterface):
     def _create_atmosphere(self,
                                 planet_image: Image.Image,
                                 color: RGBA,
-                                padding: int,
-                                has_rings: bool) -> Image.Image:
-        # The has_rings parameter is used to adjust the scattering effect
+                                padding: int) -> Image.Image:
         """
         Create a realistic atmosphere with scattering effect.
 
@@ -224,7 +479,6 @@ class Atmosphere(AtmosphereInterface):
             planet_image: Base planet image
             color: RGBA color tuple for the atmosphere
             padding: Padding around the planet for the atmosphere
-            has_rings: Whether the planet has rings (affects certain parameters)
 
         Returns:
             Image with realistic atmospheric effects applied
@@ -241,60 +495,44 @@ class Atmosphere(AtmosphereInterface):
         # Log the padding used
         logger.debug(f"Atmosphere padding: {padding}px + {extra_padding}px extra (canvas size: {canvas_size}px)", "atmosphere")
 
-        result = Image.new("RGBA", (canvas_size, canvas_size), (0, 0, 0, 0))
-
         # Calculate center and planet radius
         center = canvas_size // 2
         planet_radius = size // 2
 
-        # Create the base atmosphere layer
-        atmosphere = Image.new("RGBA", (canvas_size, canvas_size), (0, 0, 0, 0))
-        atmosphere_draw = ImageDraw.Draw(atmosphere)
-
-        # Draw the atmosphere as a larger circle
+        # Create the base atmosphere layer (blurred glow around the planet)
         atmosphere_radius = planet_radius + padding
-        atmosphere_draw.ellipse(
-            (center - atmosphere_radius, center - atmosphere_radius,
-             center + atmosphere_radius, center + atmosphere_radius),
-            fill=color
+        atmosphere = self._create_atmosphere_glow(
+            atmosphere_radius,
+            color,
+            padding
         )
 
-        # Apply blur for a nice glow effect
-        # Calculate blur radius based on padding and density
-        # Use a larger blur radius to make the desvanecimiento more noticeable
-        blur_radius = max(2, int(padding * 0.8 * self.density))
-
-        # Apply multiple blur passes for a more gradual fade-out effect
-        for _ in range(2):
-            atmosphere = atmosphere.filter(ImageFilter.GaussianBlur(blur_radius))
-
         # Create the scattering effect (limb brightening)
         scattering_layer = self._create_scattering_effect(
-            canvas_size,
-            center,
             planet_radius,
             atmosphere_radius,
-            color,
-            has_rings
+            color
         )
 
-        # Composite the base atmosphere and scattering effect
-        result = Image.alpha_composite(result, atmosphere)
-
-        # Only apply scattering if the parameter is > 0
-        if self.scattering > 0:
-            result = Image.alpha_composite(result, scattering_layer)
-
         # Create the atmosphere line (thin bright line at the edge of the planet)
         atmosphere_line = self._create_atmosphere_line(
-            canvas_size,
-            center,
             planet_radius,
             color
         )
 
-        # Composite the atmosphere line
-        result = Image.alpha_composite(result, atmosphere_line)
+        # Composite the base atmosphere, scattering effect and atmosphere line
+        # Layers that would be fully transparent are skipped (returned as None)
+        layers = [layer for layer in (atmosphere, scattering_layer, atmosphere_line) if layer is not None]
+
+        # All layers are radial, so they are stacked in 1D and the canvas is
+        # filled in a single pass over the window that contains them
+        result_array = np.zeros((canvas_size, canvas_size, 4), dtype=np.uint8)
+        if layers:
+            radii, channels = _composite_radial_profiles(layers)
+            window = _radial_window(canvas_size, center, radii[-1])
+            result_array[window] = _render_radial_profile(_lut_index_grid(canvas_size, center)[window],
+                                                          radii, channels)
+        result = Image.fromarray(result_array, "RGBA")
 
         # Paste the planet in the center
         planet_pos = (center - planet_radius, center - planet_radius)
@@ -302,43 +540,72 @@ class Atmosphere(AtmosphereInterface):
 
         return result
 
+    def _create_atmosphere_glow(self,
+                                atmosphere_radius: int,
+                                color: RGBA,
+                                padding: int) -> Optional[RadialProfile]:
+        """
+        Create the soft base glow of the atmosphere.
+
+        Args:
+            atmosphere_radius: Radius of the atmosphere
+            color: RGBA color tuple for the atmosphere
+            padding: Padding around the planet for the atmosphere
+
+        Returns:
+            Radial profile of the blurred atmosphere glow, or None if it would be invisible
+        """
+        # A fully transparent color leaves nothing to draw
+        if color[3] == 0:
+            return None
+
+        # Calculate blur radius based on padding and density
+        # Use a larger blur radius to make the desvanecimiento more noticeable
+        blur_radius = max(2, int(padding * 0.8 * self.density))
+
+        # The glow is a filled disc blurred twice with this radius, which is the
+        # same as a single Gaussian with sqrt(2) times the radius. The profile of
+        # a blurred disc edge is known analytically, so evaluate it directly from
+        # the distance to the center instead of drawing and convolving the disc.
+        sigma = blur_radius * math.sqrt(2)
+
+        # Sample the edge profile (0.5 * erfc) once in 1D from the center outwards
+        # The drawn disc covers whole pixels, so its edge sits half a pixel out
+        edge_radius = atmosphere_radius + 0.5
+        sample_radii = np.arange(0.0, edge_radius + 4 * sigma, _PROFILE_STEP)
+        sample_falloff = 0.5 * _erfc((sample_radii - edge_radius) / (sigma * math.sqrt(2)))
+
+        # Fade both color and alpha, matching a blur of the color over transparent black
+        channels = sample_falloff[:, np.newaxis] * np.array(color, dtype=np.float64)
+
+        # The samples stop 4 sigma past the edge, where the glow has fully faded
+        return sample_radii, channels
+
     def _create_scattering_effect(self,
-                                 canvas_size: int,
-                                 center: int,
                                  planet_radius: int,
                                  atmosphere_radius: int,
-                                 color: RGBA,
-                                 has_rings: bool) -> Image.Image:
+                                 color: RGBA) -> Optional[RadialProfile]:
         """
         Create the light scattering effect (limb brightening).
 
         Args:
-            canvas_size: Size of the canvas
-            center: Center point of the canvas
             planet_radius: Radius of the planet
             atmosphere_radius: Radius of the atmosphere
             color: RGBA color tuple for the atmosphere
 
         Returns:
-            Image with scattering effect
+            Radial profile of the scattering effect, or None if it would be invisible
         """
-        # Create a new layer for the scattering effect
-        scattering = Image.new("RGBA", (canvas_size, canvas_size), (0, 0, 0, 0))
-        scattering_draw = ImageDraw.Draw(scattering)
-
         # Extract and enhance color for scattering
         r, g, b, a = color
 
         # Make the scattering color much brighter to simulate light emission
         # Higher values create a more intense glow effect
-        scattering_r = min(255, int(r * 2.5))
-        scattering_g = min(255, int(g * 2.5))
-        scattering_b = min(255, int(b * 2.5))
+        scattering_r, scattering_g, scattering_b = self.color_palette.adjust_brightness((r, g, b), 2.5)
 
         # Calculate the scattering intensity based on the scattering parameter
         # Higher alpha makes the scattering more visible
         scattering_alpha = int(min(255, a * 3 * self.scattering))
-        scattering_color = (scattering_r, scattering_g, scattering_b, scattering_alpha)
 
         # Calculate the thickness of the scattering effect
         # Make the scattering very thin but still visible
@@ -352,112 +619,109 @@ class Atmosphere(AtmosphereInterface):
         # Calculate final thickness with a minimum of 1 pixel
         scattering_thickness = max(1, int(base_thickness * density_factor))
 
-        # Draw multiple concentric circles with decreasing opacity to create the scattering effect
+        # Evaluate the 20 concentric circles with decreasing opacity as arrays
         steps = 20
-        for i in range(steps):
-            # Calculate progress (0 to 1)
-            t = i / (steps - 1)
-
-            # Calculate current radius - concentrate near the planet's edge
-            # Use a non-linear distribution to concentrate more at the edge
-            if t < 0.5:
-                # Inner half - concentrate at the planet's edge
-                factor = t * 2  # 0 to 1
-                current_radius = planet_radius + scattering_thickness * factor
-            else:
-                # Outer half - extend into the atmosphere, but limit the maximum extension
-                factor = (t - 0.5) * 2  # 0 to 1
-                base_extension = scattering_thickness
-
-                # Calculate the maximum extension based on the planet radius
-                # Use a muy pequeño porcentaje para hacer el scattering muy angosto pero visible
-                max_extension_factor = 0.03  # 3% of the planet radius
-
-                max_extension = planet_radius * max_extension_factor
-                available_extension = min(atmosphere_radius - planet_radius - scattering_thickness, max_extension)
-
-                additional_extension = available_extension * factor
-                current_radius = planet_radius + base_extension + additional_extension
-
-            # Calculate alpha - create a more dramatic fade-out effect
-            # Use a non-linear curve for more visible desvanecimiento
-            if t < 0.2:
-                # Near the planet's edge - highest intensity
-                alpha_factor = 1.0 - (t * 2.5)  # 1.0 to 0.5 (steeper drop)
-            elif t < 0.5:
-                # Middle region - medium intensity with faster drop-off
-                alpha_factor = 0.5 - ((t - 0.2) * 1.2)  # 0.5 to 0.14
-            else:
-                # Outer region - very low intensity that fades to zero
-                alpha_factor = 0.14 * (1 - ((t - 0.5) / 0.5))  # 0.14 to 0 (more gradual)
+        t = np.linspace(0.0, 1.0, steps)
+
+        # Calculate the radius of each circle - concentrate near the planet's edge
+        # Inner half - concentrate at the planet's edge
+        # Outer half - extend into the atmosphere, but limit the maximum extension
+        # Use a muy pequeño porcentaje para hacer el scattering muy angosto pero visible
+        max_extension_factor = 0.03  # 3% of the planet radius
+        max_extension = planet_radius * max_extension_factor
+        available_extension = min(atmosphere_radius - planet_radius - scattering_thickness, max_extension)
+        radii = np.where(
+            t < 0.5,
+            planet_radius + scattering_thickness * (t * 2),
+            planet_radius + scattering_thickness + available_extension * ((t - 0.5) * 2)
+        )
 
-            # Apply the scattering parameter to the alpha
-            alpha_factor *= self.scattering
+        # Calculate alpha - create a more dramatic fade-out effect
+        # Near the planet's edge - highest intensity (1.0 to 0.5, steeper drop)
+        # Middle region - medium intensity with faster drop-off (0.5 to 0.14)
+        # Outer region - very low intensity that fades to zero (0.14 to 0)
+        alpha_factors = np.select(
+            [t < 0.2, t < 0.5],
+            [1.0 - (t * 2.5), 0.5 - ((t - 0.2) * 1.2)],
+            0.14 * (1 - ((t - 0.5) / 0.5))
+        )
 
-            # Create color with adjusted alpha
-            current_alpha = int(scattering_alpha * alpha_factor)
-            current_color = (scattering_r, scattering_g, scattering_b, current_alpha)
+        # Apply the scattering parameter to the alpha
+        alpha_factors *= self.scattering
+        alphas = (scattering_alpha * alpha_factors).astype(np.int32)
 
-            # Draw the circle
-            scattering_draw.ellipse(
-                (center - current_radius, center - current_radius,
-                 center + current_radius, center + current_radius),
-                outline=current_color, width=2
-            )
+        # Skip the layer when every circle would be drawn fully transparent
+        if alphas.max() <= 0:
+            return None
+
+        # Each circle is a 2px wide outline inside its radius, so its center line
+        # sits half a pixel inside. Interpolate the radial alpha profile between
+        # circles and color the whole band they cover.
+        band_inner = radii[0] - 1.5
+        band_outer = radii[-1] + 0.5
 
         # Apply a slight blur to smooth the scattering effect
+        # The band is a thin ring, so the blur is applied to its radial profile
         blur_amount = max(1, int(3 * self.scattering))
-        scattering = scattering.filter(ImageFilter.GaussianBlur(blur_amount))
+        sample_radii = _sample_radii(band_inner, band_outer, blur_amount)
+        band = ((sample_radii >= band_inner) & (sample_radii <= band_outer)).astype(np.float64)
+        alpha = np.interp(sample_radii, radii - 0.5, alphas, left=0, right=0) * band
+
+        # Color the band and fade its alpha separately, as the circles were drawn
+        band = _blur_radial_profile(band, blur_amount)
+        alpha = _blur_radial_profile(alpha, blur_amount)
+        channels = np.column_stack((band * scattering_r, band * scattering_g,
+                                    band * scattering_b, alpha))
 
-        return scattering
+        return sample_radii, channels
 
     def _create_atmosphere_line(self,
-                               canvas_size: int,
-                               center: int,
                                planet_radius: int,
-                               color: RGBA) -> Image.Image:
+                               color: RGBA) -> Optional[RadialProfile]:
         """
         Create a thin bright line at the edge of the planet to simulate the atmosphere edge.
 
         Args:
-            canvas_size: Size of the canvas
-            center: Center point of the canvas
             planet_radius: Radius of the planet
             color: RGBA color tuple for the atmosphere
 
         Returns:
-            Image with atmosphere line
+            Radial profile of the atmosphere line, or None if it would be invisible
         """
-        # Create a new layer for the atmosphere line
-        line_layer = Image.new("RGBA", (canvas_size, canvas_size), (0, 0, 0, 0))
-        line_draw = ImageDraw.Draw(line_layer)
-
         # Extract and enhance color for the line
         r, g, b, a = color
 
         # Make the line color much brighter
-        line_r = min(255, int(r * 2.0))
-        line_g = min(255, int(g * 2.0))
-        line_b = min(255, int(b * 2.0))
+        line_r, line_g, line_b = self.color_palette.adjust_brightness((r, g, b), 2.0)
 
         # Calculate the line alpha based on the scattering parameter
         # Higher scattering means more visible line
         line_alpha = int(min(255, 150 * self.scattering))
         line_color = (line_r, line_g, line_b, line_alpha)
 
+        # A fully transparent line leaves nothing to draw
+        if line_alpha == 0:
+            return None
+
         # Draw the atmosphere line as a thin circle at the planet's edge
         # Slightly larger than the planet radius
         line_radius = planet_radius + 1
         line_width = max(1, int(2 * self.density))
 
-        line_draw.ellipse(
-            (center - line_radius, center - line_radius,
-             center + line_radius, center + line_radius),
-            outline=line_color, width=line_width
-        )
+        # Rasterize the line as a ring from the distance to the center
+        # The outline covers line_width pixels inside its radius, plus half a pixel
+        # for the pixel the radius falls on; the edges are antialiased by coverage
+        outer_edge = line_radius + 0.5
+        inner_edge = outer_edge - line_width
 
         # Apply a slight blur to smooth the line
+        # The line is a thin ring, so the blur is applied to its radial profile
         blur_amount = max(1, int(2 * self.scattering))
-        line_layer = line_layer.filter(ImageFilter.GaussianBlur(blur_amount))
+        sample_radii = _sample_radii(inner_edge, outer_edge, blur_amount)
+        coverage = (np.clip(outer_edge + 0.5 - sample_radii, 0.0, 1.0) -
+                    np.clip(inner_edge + 0.5 - sample_radii, 0.0, 1.0))
+
+        coverage = _blur_radial_profile(coverage, blur_amount)
+        channels = coverage[:, np.newaxis] * np.array(line_color, dtype=np.float64)
 
-        return line_layer
+        return sample_radii, channels
@@ -222,57 +222,39 @@ class Clouds(CloudsInterface):
             lambda x, y: self.noise_gen.fractal_simplex(x, y, 1, 0.5, 2.0, 0.6)
         )
 
-        # Combine the noise layers to create realistic cloud formations
-        combined_noise = np.zeros((self.size, self.size), dtype=np.float32)
-
-        for y in range(self.size):
-            for x in range(self.size):
-                # Base shape (40%) - main cloud formations
-                base = base_cloud_noise[y, x]
-                # Cellular component (25%) - creates distinct cumulus shapes
-                cellular = cellular_noise[y, x]
-                # Detail (10%) - adds texture to clouds
-                detail = detail_noise[y, x]
-                # Connection (15%) - creates bridges between cloud formations
-                connection = connection_noise[y, x]
-                # Organization (10%) - large-scale structure
-                organization = organization_noise[y, x]
-
-                # Combine with weights for realistic cloud formations
-                combined = (base * 0.4 +
-                           cellular * 0.25 +
-                           detail * 0.1 +
-                           connection * 0.15 +
-                           organization * 0.1)
-
-                # Create more defined cloud edges
-                if combined > 0.45:
-                    # Boost higher values to create more defined clouds
-                    boost_factor = (combined - 0.45) * 0.5
-                    combined += boost_factor
-                    combined = min(1.0, combined)  # Cap at 1.0
-
-                # Create clear separation between clouds and gaps
-                if combined < 0.4:
-                    # Reduce lower values to create clearer gaps
-                    reduction_factor = (0.4 - combined) * 0.5
-                    combined -= reduction_factor
-                    combined = max(0.0, combined)  # Keep within 0-1 range
-
-                # Apply a non-linear curve to create puffy cloud shapes
-                if combined > 0.4 and combined < 0.7:
-                    # Create more pronounced edges for cumulus appearance
-                    factor = (combined - 0.4) / 0.3  # 0 to 1 in the 0.4-0.7 range
-                    # Use a steeper curve for more defined cloud edges
-                    curve_factor = math.pow(factor, 1.5)  # Steeper curve for puffy appearance
-                    combined = 0.4 + curve_factor * 0.3  # More defined transition
-
-                # Add slight variation for natural appearance
-                variation = (self.rng.random() - 0.5) * 0.01  # Small random variation
-                combined = max(0.0, min(1.0, combined + variation))  # Keep within 0-1 range
-
-                # Store the result
-                combined_noise[y, x] = combined
+        # Combine the noise layers with weights for realistic cloud formations:
+        # base shape (40%) for the main cloud formations, cellular component (25%)
+        # for distinct cumulus shapes, detail (10%) for texture, connection (15%)
+        # for bridges between formations and organization (10%) for large-scale structure
+        combined = (base_cloud_noise * 0.4 +
+                    cellular_noise * 0.25 +
+                    detail_noise * 0.1 +
+                    connection_noise * 0.15 +
+                    organization_noise * 0.1).astype(np.float32)
+
+        # Create more defined cloud edges
+        # Boost higher values to create more defined clouds, capped at 1.0
+        high = combined > 0.45
+        combined[high] = np.minimum(1.0, combined[high] + (combined[high] - 0.45) * 0.5)
+
+        # Create clear separation between clouds and gaps
+        # Reduce lower values to create clearer gaps, keeping them within 0-1
+        low = combined < 0.4
+        combined[low] = np.maximum(0.0, combined[low] - (0.4 - combined[low]) * 0.5)
+
+        # Apply a non-linear curve to create puffy cloud shapes
+        # Use a steeper curve in the 0.4-0.7 range for more defined cumulus edges
+        band = (combined > 0.4) & (combined < 0.7)
+        factor = (combined[band] - 0.4) / 0.3
+        combined[band] = 0.4 + np.power(factor, 1.5) * 0.3
+
+        # Add slight variation for natural appearance
+        # The values are drawn from self.rng in the same row-major order as before,
+        # so the rest of the generation sees the same random sequence
+        variation = np.fromiter((self.rng.random() for _ in range(self.size * self.size)),
+                                dtype=np.float64, count=self.size * self.size)
+        variation = ((variation - 0.5) * 0.01).astype(np.float32).reshape(self.size, self.size)
+        combined_noise = np.clip(combined + variation, 0.0, 1.0)
 
         # Store the cloud noise for later use
         self.cloud_noise = combined_noise
@@ -459,58 +441,13 @@ class Clouds(CloudsInterface):
         Apply lighting effects to the cloud texture with EXACTLY the same parameters as the planet.
         This ensures perfect alignment of shadows and highlights between terrain and clouds.
         """
-        # Calculate light direction vector with the same angle as the planet
-        light_rad = math.radians(self.light_angle)
-        light_x = math.cos(light_rad)
-        light_y = -math.sin(light_rad)  # Negative because y increases downward in images
-
-        # Convert image to numpy array for processing
-        img_array = np.array(self.cloud_texture)
-        height, width = img_array.shape[:2]
-        center_x, center_y = width // 2, height // 2
-        radius = min(center_x, center_y)
-
-        # Create a new array for the result
-        result_array = np.zeros_like(img_array)
-
-        # Process each pixel to apply lighting
-        for y in range(height):
-            for x in range(width):
-                # Skip if the pixel is transparent
-                if img_array[y, x, 3] == 0:
-                    continue
-
-                # Calculate position relative to center - EXACTLY as in TextureGenerator.apply_lighting
-                dx = (x - center_x) / radius
-                dy = (y - center_y) / radius
-                distance = math.sqrt(dx*dx + dy*dy)
-
-                # Skip if outside the sphere
-                if distance > 1.0:
-                    continue
-
-                # Calculate surface normal at this point - EXACTLY as in TextureGenerator.apply_lighting
-                z = math.sqrt(1.0 - distance*distance)
-                nx, ny, nz = dx, dy, z
-
-                # Calculate dot product with light direction - EXACTLY as in TextureGenerator.apply_lighting
-                dot = nx * light_x + ny * light_y + nz * 1.0
-
-                # Apply lighting factor - EXACTLY as in TextureGenerator.apply_lighting
-                if dot < 0:
-                    # Point is facing away from light
-                    factor = 0.1  # Ambient light - same as terrain
-                else:
-                    # Apply light intensity and falloff - same as terrain
-                    factor = 0.1 + 0.9 * self.light_intensity * (dot ** self.light_falloff)
-
-                # Apply lighting to color channels
-                r = min(255, int(img_array[y, x, 0] * factor))
-                g = min(255, int(img_array[y, x, 1] * factor))
-                b = min(255, int(img_array[y, x, 2] * factor))
-
-                # Set result pixel with original alpha
-                result_array[y, x] = [r, g, b, img_array[y, x, 3]]
+        # Apply lighting with EXACTLY the same geometry and math as TextureGenerator.apply_lighting
+        result_array = lighting_utils.apply_sphere_lighting(
+            np.array(self.cloud_texture),
+            self.light_angle,
+            self.light_intensity,
+            self.light_falloff
+        )
 
         # Convert back to PIL Image
         lit_clouds = Image.fromarray(result_array)
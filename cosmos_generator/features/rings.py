@@ -100,34 +100,29 @@ class Rings(RingsInterface):
 
             # Apply noise to the texture
             texture_array = np.array(texture)
-            for y in range(height):
-                for x in range(width):
-                    # Skip transparent pixels
-                    if texture_array[y, x, 3] == 0:
-                        continue
-
-                    # Calculate distance from center
-                    dx = x - center_x
-                    dy = y - center_y
-                    distance = math.sqrt(dx*dx + dy*dy)
-
-                    # Skip pixels outside the ring
-                    if distance < inner_pixel_radius or distance > outer_pixel_radius:
-                        continue
-
-                    # Apply noise to alpha channel
-                    noise_value = ring_noise[y, x]
-                    # More noise near edges
-                    edge_factor = min(
-                        (distance - inner_pixel_radius) / (inner_pixel_radius * 0.2),
-                        (outer_pixel_radius - distance) / (outer_pixel_radius * 0.2)
-                    )
-                    edge_factor = max(0.0, min(1.0, edge_factor))
-
-                    # Apply noise and edge factor to alpha
-                    alpha = texture_array[y, x, 3]
-                    alpha = int(alpha * (0.8 + 0.2 * noise_value) * edge_factor)
-                    texture_array[y, x, 3] = alpha
+
+            # Calculate distance from center for every pixel
+            dx = np.arange(width) - center_x
+            dy = (np.arange(height) - center_y)[:, np.newaxis]
+            distance = np.sqrt(dx*dx + dy*dy)
+
+            # Only opaque pixels inside the ring receive noise
+            alpha = texture_array[:, :, 3]
+            in_ring = (
+                (alpha != 0)
+                & (distance >= inner_pixel_radius)
+                & (distance <= outer_pixel_radius)
+            )
+
+            # More noise near edges
+            edge_factor = np.clip(np.minimum(
+                (distance - inner_pixel_radius) / (inner_pixel_radius * 0.2),
+                (outer_pixel_radius - distance) / (outer_pixel_radius * 0.2)
+            ), 0.0, 1.0).astype(ring_noise.dtype)
+
+            # Apply noise and edge factor to alpha
+            noisy_alpha = alpha * (0.8 + 0.2 * ring_noise) * edge_factor
+            texture_array[:, :, 3] = np.where(in_ring, noisy_alpha.astype(np.uint8), alpha)
 
             # Convert back to image
             texture = Image.fromarray(texture_array)
@@ -195,23 +195,15 @@ def create_gradient(size: Tuple[int, int], start_color: Tuple[int, int, int, int
         center_x, center_y = width // 2, height // 2
         max_distance = np.sqrt(center_x**2 + center_y**2)
 
-        # Create a numpy array for the image
-        img_array = np.zeros((height, width, 4), dtype=np.uint8)
-
-        # Fill the array with gradient colors
-        for y in range(height):
-            for x in range(width):
-                # Calculate distance from center
-                distance = np.sqrt((x - center_x)**2 + (y - center_y)**2)
-                ratio = distance / max_distance
-
-                # Calculate color at this position
-                r = int(start_color[0] + (end_color[0] - start_color[0]) * ratio)
-                g = int(start_color[1] + (end_color[1] - start_color[1]) * ratio)
-                b = int(start_color[2] + (end_color[2] - start_color[2]) * ratio)
-                a = int(start_color[3] + (end_color[3] - start_color[3]) * ratio)
-
-                img_array[y, x] = [r, g, b, a]
+        # Calculate distance from center for every pixel
+        x = np.arange(width) - center_x
+        y = (np.arange(height) - center_y)[:, np.newaxis]
+        ratio = (np.sqrt(x**2 + y**2) / max_distance)[:, :, np.newaxis]
+
+        # Calculate the color at every position, one RGBA channel per plane
+        start = np.array(start_color, dtype=np.float64)
+        end = np.array(end_color, dtype=np.float64)
+        img_array = np.trunc(start + (end - start) * ratio).astype(np.uint8)
 
         # Convert array back to image
         image = Image.fromarray(img_array, mode="RGBA")
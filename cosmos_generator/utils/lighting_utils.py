@@ -2,6 +2,7 @@
 Lighting and shading utilities.
 """
 from typing import Tuple, Optional
+import functools
 import math
 import numpy as np
 from PIL import Image, ImageDraw
@@ -108,8 +109,8 @@ def apply_directional_light(image: Image.Image, normal_map: np.ndarray,
         specular_map = spec_dot ** shininess
 
     # Apply lighting to the image
-    # Create a copy of the array with float32 type for calculations
-    result_float = img_array.copy().astype(np.float32)  # Convert to float32 to avoid overflow
+    # Compute the lit RGB channels in float32 to avoid overflow
+    result_float = np.empty(img_array.shape[:2] + (3,), dtype=np.float32)
 
     # RGB channels
     for i in range(3):
@@ -121,11 +122,11 @@ def apply_directional_light(image: Image.Image, normal_map: np.ndarray,
             result_float[:, :, i] += 255 * specular * specular_map
 
     # Clip values to valid range and convert back to uint8
-    result = img_array.copy()  # Keep original array structure with uint8
-    result[:, :, :3] = np.clip(result_float[:, :, :3], 0, 255).astype(np.uint8)
+    # img_array is already a private copy of the image, so write into it directly
+    img_array[:, :, :3] = np.clip(result_float, 0, 255).astype(np.uint8)
 
     # Create new image from the modified array
-    return Image.fromarray(result)
+    return Image.fromarray(img_array)
 
 
 def create_shadow_mask(size: Tuple[int, int], light_angle: float = 45.0,
@@ -200,37 +201,28 @@ def apply_ambient_occlusion(image: Image.Image, strength: float = 0.5) -> Image.
 
     # Create a mask for the edges
     width, height = image.size
-    mask = Image.new("L", (width, height), 255)
-    draw = ImageDraw.Draw(mask)
 
-    # Draw a filled circle with a gradient from edge to center
+    # Build a filled circle with a gradient from edge to center
     radius = min(width, height) // 2
     center_x, center_y = width // 2, height // 2
 
-    # Create a numpy array for the mask
-    mask_array = np.zeros((height, width), dtype=np.uint8)
-
-    # Fill the array with gradient values
-    for y in range(height):
-        for x in range(width):
-            # Calculate distance from center
-            dx = x - center_x
-            dy = y - center_y
-            distance = math.sqrt(dx*dx + dy*dy)
+    # Calculate distance from center for every pixel
+    dx = np.arange(width) - center_x
+    dy = (np.arange(height) - center_y)[:, np.newaxis]
+    distance = np.sqrt(dx*dx + dy*dy)
 
-            # Skip if outside the circle
-            if distance > radius:
-                continue
+    # Calculate occlusion value (stronger at edges)
+    # 1.0 at the edge, 0.0 at the center
+    occlusion = distance / radius
 
-            # Calculate occlusion value (stronger at edges)
-            # 1.0 at the edge, 0.0 at the center
-            occlusion = distance / radius
+    # Apply strength
+    occlusion *= strength
 
-            # Apply strength
-            occlusion *= strength
-
-            # Store in the mask array
-            mask_array[y, x] = 255 - int(occlusion * 255)
+    # Fill the mask with gradient values, leaving pixels outside the circle at 0
+    # Strengths above 1 push the values below 0, so clip them before the cast
+    mask_array = np.clip(
+        np.where(distance > radius, 0, 255 - np.trunc(occlusion * 255)), 0, 255
+    ).astype(np.uint8)
 
     # Convert array to mask
     mask = Image.fromarray(mask_array)
@@ -245,3 +237,87 @@ def apply_ambient_occlusion(image: Image.Image, strength: float = 0.5) -> Image.
 
     # Create new image from the modified array
     return Image.fromarray(img_array)
+
+
+@functools.lru_cache(maxsize=8)
+def _sphere_geometry(width: int, height: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the unit sphere surface seen from the front for an image size.
+
+    The geometry only depends on the image size, so it is cached and shared by
+    every lighting pass on images of the same size.
+
+    Args:
+        width: Width of the image
+        height: Height of the image
+
+    Returns:
+        Tuple of read-only arrays (dx, dy, z, inside): the normal components of
+        every pixel (dx is a row, dy a column, both broadcastable to the image)
+        and a boolean mask of the pixels inside the sphere
+    """
+    center_x, center_y = width // 2, height // 2
+    radius = min(center_x, center_y)
+
+    # Calculate position of every pixel relative to center
+    dx = ((np.arange(width) - center_x) / radius)[np.newaxis, :]
+    dy = ((np.arange(height) - center_y) / radius)[:, np.newaxis]
+    distance = np.sqrt(dx*dx + dy*dy)
+    inside = distance <= 1.0
+
+    # For a sphere, the normal is just the normalized vector from center to point
+    z = np.sqrt(np.maximum(1.0 - distance*distance, 0.0))
+
+    for array in (dx, dy, z, inside):
+        array.setflags(write=False)
+    return dx, dy, z, inside
+
+
+def apply_sphere_lighting(pixels: np.ndarray, light_angle: float = 45.0,
+                          light_intensity: float = 1.0, falloff: float = 0.6) -> np.ndarray:
+    """
+    Apply directional lighting to the pixels of a spherical RGBA image.
+
+    Pixels outside the sphere or fully transparent become transparent black.
+
+    Args:
+        pixels: RGBA pixel data as a (height, width, 4) uint8 array
+        light_angle: Angle of the light source in degrees (0 = right, 90 = top)
+        light_intensity: Intensity of the light
+        falloff: Light falloff factor (higher values create sharper shadows)
+
+    Returns:
+        New (height, width, 4) uint8 array with lighting applied
+    """
+    # Calculate light direction
+    light_rad = math.radians(light_angle)
+    light_x = math.cos(light_rad)
+    light_y = -math.sin(light_rad)  # Negative because y increases downward in images
+
+    # Apply lighting to the image
+    # Calculate surface normal at each point of the sphere
+    height, width = pixels.shape[:2]
+    dx, dy, z, in_sphere = _sphere_geometry(width, height)
+
+    # Only light opaque pixels inside the sphere; everything else stays transparent black
+    inside = in_sphere & (pixels[:, :, 3] != 0)
+
+    # Calculate dot product with light direction
+    dot = dx * light_x + dy * light_y + z * 1.0
+
+    # Apply lighting factor
+    # Points facing away from light only get ambient light, the rest
+    # get light intensity and falloff on top
+    factor = np.where(
+        dot < 0,
+        0.1,
+        0.1 + 0.9 * light_intensity * np.power(np.maximum(dot, 0.0), falloff)
+    )
+
+    # Apply lighting to color
+    result_pixels = np.zeros_like(pixels)
+    lit = np.minimum(255, pixels[:, :, :3] * factor[:, :, np.newaxis])
+    result_pixels[:, :, :3] = np.where(inside[:, :, np.newaxis], lit, 0).astype(np.uint8)
+    result_pixels[:, :, 3] = np.where(inside, pixels[:, :, 3], 0)
+
+    return result_pixels
@@ -1,13 +1,20 @@
 """
 Tests for the Atmosphere class.
 """
+import os
+import threading
+
 import pytest
 import numpy as np
-from PIL import Image
+from PIL import Image, ImageDraw
 
 from cosmos_generator.features.atmosphere import Atmosphere
 
 
+# Reference renders from the original PIL drawing and blurring implementation
+REFERENCE_DIR = os.path.join(os.path.dirname(__file__), "data", "atmosphere")
+
+
 @pytest.fixture
 def atmosphere():
     """
@@ -104,6 +111,51 @@ def test_atmosphere_glow(atmosphere, test_image):
     assert semi_transparent_pixels > 0
 
 
+def test_atmosphere_invisible_layers_skipped(atmosphere):
+    """
+    Test that layers which would be fully transparent are not rendered.
+    """
+    atmosphere.scattering = 0.0
+    color = (100, 150, 200, 80)
+
+    assert atmosphere._create_atmosphere_glow(60, (100, 150, 200, 0), 10) is None
+    assert atmosphere._create_scattering_effect(50, 60, color) is None
+    assert atmosphere._create_atmosphere_line(50, color) is None
+
+    # The glow is still rendered with a visible color
+    assert atmosphere._create_atmosphere_glow(60, color, 10) is not None
+
+
+@pytest.mark.parametrize("scattering", [0.7, 1.0])
+def test_atmosphere_tiny_planets(scattering):
+    """
+    Test that the atmosphere handles planets smaller than the blur kernels.
+    """
+    atmosphere = Atmosphere(seed=1, scattering=scattering)
+    color = (10, 20, 30, 200)
+
+    for size in range(2, 11):
+        planet = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        ImageDraw.Draw(planet).ellipse((0, 0, size - 1, size - 1), fill=(255, 0, 0, 255))
+        planet_array = np.array(planet)
+        planet_disc = planet_array[:, :, 3] == 255
+
+        result = np.array(atmosphere.apply_to_planet(planet, "Desert", color=color))
+
+        # Check that the planet pixels are preserved in the center of the canvas
+        offset = result.shape[0] // 2 - size // 2
+        on_planet = np.zeros(result.shape[:2], dtype=bool)
+        on_planet[offset:offset + size, offset:offset + size] = planet_disc
+        assert np.array_equal(result[on_planet], planet_array[planet_disc])
+
+        # Check that the atmosphere is visible around the planet
+        # A 2px planet fills its whole canvas, so render the atmosphere alone for it
+        if on_planet.all():
+            result = np.array(atmosphere.apply_to_planet(Image.new("RGBA", (size, size)), "Desert", color=color))
+            on_planet[:] = False
+        assert result[~on_planet, 3].max() > 0
+
+
 def test_atmosphere_halo(atmosphere, test_image):
     """
     Test that atmosphere halo is applied correctly.
@@ -175,6 +227,34 @@ def test_atmosphere_blur(atmosphere, test_image):
     assert not np.array_equal(np.array(result_low_density_resized), np.array(result_high_density_resized))
 
 
+@pytest.mark.parametrize("size, scattering, density, has_rings, color", [
+    (64, 0.7, 0.9, True, (255, 120, 60, 75)),
+    (150, 0.7, 0.5, False, (100, 150, 255, 120)),
+    (150, 1.0, 0.9, True, (255, 120, 60, 75)),
+    (300, 0.3, 0.2, False, (40, 200, 120, 200)),
+])
+def test_atmosphere_matches_reference(size, scattering, density, has_rings, color):
+    """
+    Test that the NumPy atmosphere stays within the documented tolerance of
+    the reference renders.
+    """
+    planet = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    ImageDraw.Draw(planet).ellipse((0, 0, size - 1, size - 1), fill=(90, 60, 30, 255))
+
+    atmosphere = Atmosphere(seed=12345, scattering=scattering, density=density)
+    result = np.array(atmosphere.apply_to_planet(planet, "Desert", has_rings=has_rings, color=color))
+
+    name = f"{size}_{scattering}_{density}_{int(has_rings)}.png"
+    reference = np.array(Image.open(os.path.join(REFERENCE_DIR, name)))
+    assert result.shape == reference.shape
+
+    # Only soft edge pixels drift: at most 25/255 in color and 28/255 in alpha
+    diff = np.abs(result.astype(np.int16) - reference.astype(np.int16))
+    assert diff[..., :3].max() <= 25
+    assert diff[..., 3].max() <= 28
+    assert diff.mean() < 1.0
+
+
 def test_atmosphere_with_planet_colors(atmosphere, test_image):
     """
     Test that atmosphere uses the planet colors to derive the atmosphere color.
@@ -229,3 +309,40 @@ def test_atmosphere_with_planet_colors(atmosphere, test_image):
     # Check that the average colors are different
     # We use a tolerance because the colors might be similar but not identical
     assert not (np.allclose(avg_color1, avg_color2, atol=5) and np.allclose(avg_color1, avg_color3, atol=5))
+
+
+def test_atmosphere_batch(test_image, monkeypatch):
+    """
+    Test that applying the atmosphere to a batch matches applying it one by one.
+    """
+    images = [test_image.resize((size, size)) for size in (60, 80, 100, 120, 140, 160)]
+
+    # Colors from the seeded palette, from the planet colors and a custom color
+    for kwargs in ({},
+                   {"base_color": (210, 180, 140), "highlight_color": (255, 222, 173)},
+                   {"color": (120, 180, 255, 90)}):
+        batch = Atmosphere(seed=12345)
+        sequential = Atmosphere(seed=12345)
+
+        results = batch.apply_to_planets(images, "Jovian", max_workers=3, **kwargs)
+
+        assert len(results) == len(images)
+        for image, result in zip(images, results):
+            expected = sequential.apply_to_planet(image, "Jovian", **kwargs)
+            assert result.size == expected.size
+            assert np.array_equal(np.array(result), np.array(expected))
+
+        assert batch.last_color == sequential.last_color
+
+    # Palette colors are drawn in order on the calling thread, not by the workers
+    atmosphere = Atmosphere(seed=12345)
+    draw_threads = []
+    get_atmosphere_color = atmosphere.color_palette.get_atmosphere_color
+
+    def recording_get_atmosphere_color(planet_type):
+        draw_threads.append(threading.current_thread())
+        return get_atmosphere_color(planet_type)
+
+    monkeypatch.setattr(atmosphere.color_palette, "get_atmosphere_color", recording_get_atmosphere_color)
+    atmosphere.apply_to_planets(images, "Jovian", max_workers=3)
+    assert draw_threads == [threading.current_thread()] * len(images)
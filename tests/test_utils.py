@@ -10,6 +10,7 @@ from PIL import Image
 
 import config
 from cosmos_generator.utils.image_utils import create_circle_mask, rotate_image
+from cosmos_generator.utils.lighting_utils import apply_sphere_lighting
 from cosmos_generator.utils.math_utils import lerp, clamp, normalize_value
 from cosmos_generator.utils.directory_utils import ensure_directory_structure
 from cosmos_generator.utils.random_utils import RandomGenerator
@@ -74,6 +75,35 @@ class TestImageUtils:
         assert np.any(center_column[:, 0] > 200)  # Some pixels in the center column should be bright
 
 
+class TestLightingUtils:
+    """
+    Tests for lighting utility functions.
+    """
+
+    def test_apply_sphere_lighting(self):
+        """
+        Test that sphere lighting darkens the side facing away from the light.
+        """
+        size = 64
+        pixels = np.full((size, size, 4), 200, dtype=np.uint8)
+
+        # Light from the right
+        result = apply_sphere_lighting(pixels, light_angle=0.0)
+
+        # Check that the shape and type are preserved
+        assert result.shape == pixels.shape
+        assert result.dtype == np.uint8
+
+        # Corners are outside the sphere and become transparent
+        assert tuple(result[0, 0]) == (0, 0, 0, 0)
+
+        # The lit side is brighter than the dark side, which only gets ambient light
+        center = size // 2
+        assert result[center, size - 8, 0] > result[center, 8, 0]
+        assert result[center, 1, 0] == int(200 * 0.1)
+        assert result[center, center, 3] == 200
+
+
 class TestMathUtils:
     """
     Test cases for math utility functions.